@@ -18,10 +18,26 @@ class DeviceInfo:
     extra: dict = field(default_factory=dict)
 
 
-@dataclass
+# Slotted: one Chunk is allocated per device read on the acquisition thread,
+# so it skips the per-instance __dict__.
+@dataclass(slots=True)
 class Chunk:
     data: np.ndarray  # shape (channel_count, n_samples), float32, microvolts
     timestamps: np.ndarray  # shape (n_samples,), seconds
+    # Stream-wide index of data[:, 0]; set by Stream when the chunk is acquired,
+    # None for a chunk that never went through one.
+    first_sample: int | None = None
+
+
+def backfilled_timestamps(last: float, n: int, fs: float) -> np.ndarray:
+    """Evenly spaced stamps for *n* samples whose newest arrived at *last*.
+
+    Devices that buffer samples on a reader thread take one clock read
+    (``time.monotonic()``) per arriving block instead of one per sample; the
+    per-sample stamps are then back-filled from it at the nominal rate *fs*.
+    """
+    back = np.arange(n - 1, -1, -1, dtype=np.float64)
+    return last - back / fs
 
 
 class Device(ABC):
@@ -1,6 +1,7 @@
 """URI-based device registry: create_device('synthetic://?focus=0.8')."""
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
 from urllib.parse import ParseResult, parse_qs, urlparse
 
@@ -29,12 +30,14 @@ def list_schemes() -> list[str]:
     return sorted(_REGISTRY)
 
 
-def discover() -> list[dict]:
-    """Best-effort device discovery: always-available schemes + scanned serial ports."""
-    entries: list[dict] = [
-        {"uri": "synthetic://", "name": "Synthetic EEG (no hardware)",
-         "needs_hardware": False},
-    ]
+# Enumerating serial ports walks /dev (or the Windows registry) — cheap once,
+# but `list_devices` can be polled by MCP clients and UIs. Reuse a recent scan.
+_PORT_CACHE_TTL = 2.0  # seconds
+_port_cache: tuple[float, list[dict]] | None = None
+
+
+def _scan_serial_ports() -> list[dict]:
+    entries: list[dict] = []
     try:  # enumerate serial ports if pyserial is available
         from serial.tools import list_ports
 
@@ -46,3 +49,24 @@ def discover() -> list[dict]:
     except Exception:  # pragma: no cover
         pass
     return entries
+
+
+def _serial_ports() -> list[dict]:
+    global _port_cache
+    now = time.monotonic()
+    if _port_cache is None or now - _port_cache[0] >= _PORT_CACHE_TTL:
+        _port_cache = (now, _scan_serial_ports())
+    return _port_cache[1]
+
+
+def discover() -> list[dict]:
+    """Best-effort device discovery: always-available schemes + scanned serial ports.
+
+    The serial scan is cached for ``_PORT_CACHE_TTL`` seconds.
+    """
+    entries: list[dict] = [
+        {"uri": "synthetic://", "name": "Synthetic EEG (no hardware)",
+         "needs_hardware": False},
+    ]
+    entries.extend(dict(port) for port in _serial_ports())  # copies: callers may mutate
+    return entries
@@ -5,6 +5,16 @@ import numpy as np
 
 
 class RingBuffer:
+    """All channels in one contiguous ``(channels, capacity)`` float32 block.
+
+    There is a single allocation and a single write cursor shared by every
+    channel. Data arrives and leaves in channel-major ``Chunk`` blocks, so
+    this layout keeps each per-channel copy a contiguous memcpy; a time-major
+    layout would force a transpose on every write and read. Timestamps are
+    not stored: consumers only ever need the latest ``n`` samples at the
+    device's fixed sample rate.
+    """
+
     def __init__(self, channels: int, capacity: int) -> None:
         self.channels = channels
         self.capacity = max(1, capacity)
@@ -12,6 +22,24 @@ class RingBuffer:
         self._pos = 0  # next write column
         self._size = 0
 
+    def _wrap(self, index: int) -> int:
+        """Fold an index that is at most one lap out of range back into the buffer."""
+        if index >= self.capacity:
+            return index - self.capacity
+        if index < 0:
+            return index + self.capacity
+        return index
+
+    def _spans(self, start: int, n: int) -> tuple[slice, slice]:
+        """``n`` columns from ``start`` as at most two contiguous slices.
+
+        The second slice is empty unless the span wraps past the end of the
+        buffer. Reads and writes both go through this, so every access is one
+        or two contiguous block copies rather than a fancy-indexed gather.
+        """
+        first = min(n, self.capacity - start)
+        return slice(start, start + first), slice(0, n - first)
+
     def write(self, data: np.ndarray) -> None:
         n = data.shape[1]
         if n == 0:
@@ -21,25 +49,23 @@ class RingBuffer:
             self._pos = 0
             self._size = self.capacity
             return
-        end = self._pos + n
-        if end <= self.capacity:
-            self._buf[:, self._pos:end] = data
-        else:
-            first = self.capacity - self._pos
-            self._buf[:, self._pos:] = data[:, :first]
-            self._buf[:, : n - first] = data[:, first:]
-        self._pos = end % self.capacity
+        head, tail = self._spans(self._pos, n)
+        split = head.stop - head.start
+        self._buf[:, head] = data[:, :split]
+        self._buf[:, tail] = data[:, split:]
+        # n < capacity here, so the cursor wraps at most once: one compare and
+        # subtract instead of a modulo, without forcing a power-of-two size.
+        self._pos = self._wrap(self._pos + n)
         self._size = min(self.capacity, self._size + n)
 
     def latest(self, n: int) -> np.ndarray:
         n = min(n, self._size)
         if n == 0:
             return np.zeros((self.channels, 0), dtype=np.float32)
-        start = (self._pos - n) % self.capacity
-        if start + n <= self.capacity:
-            return self._buf[:, start : start + n].copy()
-        first = self.capacity - start
-        return np.concatenate([self._buf[:, start:], self._buf[:, : n - first]], axis=1)
+        head, tail = self._spans(self._wrap(self._pos - n), n)
+        if tail.stop == 0:
+            return self._buf[:, head].copy()
+        return np.concatenate([self._buf[:, head], self._buf[:, tail]], axis=1)
 
     def __len__(self) -> int:
         return self._size
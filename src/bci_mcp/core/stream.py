@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 import threading
-import time
+from collections import deque
 from collections.abc import Callable
 
 import numpy as np
@@ -11,55 +11,155 @@ import numpy as np
 from .device import Chunk, Device
 from .ringbuffer import RingBuffer
 
+logger = logging.getLogger(__name__)
+
+# Chunks waiting for consumer callbacks. Bounded so a consumer that falls
+# behind drops the oldest chunks instead of growing memory without limit;
+# at 32-sample chunks and 256 Hz this is two minutes of backlog.
+_MAX_PENDING_CHUNKS = 1024
+
 
 class Stream:
     def __init__(self, device: Device, buffer_seconds: float = 10.0) -> None:
         self.device = device
         capacity = int(device.info.sample_rate * buffer_seconds)
         self.buffer = RingBuffer(device.info.channel_count, capacity)
-        self._consumers: list[Callable[[Chunk], None]] = []
+        # Copy-on-write: mutators swap in a new tuple, so the dispatcher can
+        # iterate a snapshot without a lock while consumers come and go.
+        self._consumers: tuple[Callable[[Chunk], None], ...] = ()
+        self._consumers_lock = threading.Lock()
+        # Consumers that have raised at least once. Only the first failure is
+        # logged with a traceback; a consumer that raises on every chunk would
+        # otherwise format and emit a traceback several times a second.
+        self._failed: set[Callable[[Chunk], None]] = set()
         self._thread: threading.Thread | None = None
-        self._running = False
+        self._dispatcher: threading.Thread | None = None
+        self._pending: deque[Chunk] = deque(maxlen=_MAX_PENDING_CHUNKS)
+        self._wake = threading.Event()
+        # Set while stopped. Loops sleep with wait() on it, so stop() wakes
+        # them immediately instead of after the current poll period.
+        self._stopped = threading.Event()
+        self._stopped.set()
         self._lock = threading.Lock()
+        self._written = 0  # samples written to the buffer since construction
+        self._dropped = 0  # chunks evicted from _pending before any consumer saw them
+        # End index of the newest chunk every consumer has been handed, so a
+        # caller can wait for the lagging dispatcher to catch up to a sample.
+        self._delivered = 0
+        self._delivered_cond = threading.Condition()
+
+    @property
+    def samples_written(self) -> int:
+        """Monotonic count of samples acquired; changes exactly when new data lands."""
+        return self._written
+
+    @property
+    def dropped_chunks(self) -> int:
+        """Chunks discarded because consumers fell more than the backlog bound behind.
+
+        Consumers such as ``Recorder`` store gapless sample arrays, so any
+        increase while one is attached means its data has a silent gap.
+        """
+        return self._dropped
+
+    def wait_delivered(self, index: int, timeout: float) -> bool:
+        """Block until consumers have been handed every sample before *index*.
+
+        Consumers run behind acquisition, so a caller that stops on a
+        ``samples_written`` mark uses this to let the backlog reach it. Returns
+        False if that did not happen within *timeout* seconds.
+        """
+        with self._delivered_cond:
+            return self._delivered_cond.wait_for(lambda: self._delivered >= index, timeout)
 
     def add_consumer(self, callback: Callable[[Chunk], None]) -> None:
-        self._consumers.append(callback)
+        with self._consumers_lock:
+            self._consumers = (*self._consumers, callback)
 
     def remove_consumer(self, callback: Callable[[Chunk], None]) -> None:
-        if callback in self._consumers:
-            self._consumers.remove(callback)
+        with self._consumers_lock:
+            if callback in self._consumers:
+                consumers = list(self._consumers)
+                consumers.remove(callback)
+                self._consumers = tuple(consumers)
+            self._failed.discard(callback)
 
     def start(self) -> None:
-        if self._running:
+        if not self._stopped.is_set():
             return
+        # stop() only waits a bounded time, so the previous dispatcher may still
+        # be draining its backlog. Let it finish first: two dispatchers on one
+        # deque would call consumers concurrently and out of chunk order.
+        for previous in (self._thread, self._dispatcher):
+            if previous is not None:
+                previous.join()
         self.device.connect()
         self.device.start()
-        self._running = True
+        self._stopped.clear()
         self._thread = threading.Thread(target=self._run, daemon=True)
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
         self._thread.start()
+        self._dispatcher.start()
 
     def _run(self) -> None:
         chunk_samples = getattr(self.device, "chunk_samples", None)
         period = (chunk_samples / self.device.info.sample_rate) if chunk_samples else 0.01
-        while self._running:
+        while not self._stopped.is_set():
             chunk = self.device.read()
             if chunk is not None and chunk.data.shape[1] > 0:
                 with self._lock:
                     self.buffer.write(chunk.data)
+                    chunk.first_sample = self._written
+                    self._written += chunk.data.shape[1]
+                if self._consumers:
+                    # Hand off to the dispatcher thread: a slow or blocking
+                    # consumer must never delay acquisition. deque append /
+                    # popleft are atomic, so no lock is needed.
+                    if len(self._pending) == _MAX_PENDING_CHUNKS:
+                        # append() below evicts the oldest chunk.
+                        self._dropped += 1
+                        if self._dropped == 1:
+                            logger.warning(
+                                "Stream consumers fell more than %d chunks behind; "
+                                "dropping the oldest (see Stream.dropped_chunks)",
+                                _MAX_PENDING_CHUNKS)
+                    self._pending.append(chunk)
+                    self._wake.set()
+            self._stopped.wait(period)
+
+    def _dispatch(self) -> None:
+        while not self._stopped.is_set() or self._pending:
+            self._wake.wait(0.1)
+            self._wake.clear()
+            while self._pending:
+                chunk = self._pending.popleft()
                 for cb in self._consumers:
                     try:
                         cb(chunk)
                     except Exception:
-                        logging.getLogger(__name__).exception("Consumer callback raised")
-            time.sleep(period)
+                        if cb not in self._failed:
+                            self._failed.add(cb)
+                            logger.exception("Stream consumer %r raised; further errors "
+                                             "from it are logged at DEBUG", cb)
+                        elif logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Stream consumer %r raised again", cb, exc_info=True)
+                with self._delivered_cond:
+                    self._delivered = chunk.first_sample + chunk.data.shape[1]
+                    self._delivered_cond.notify_all()
 
     def latest(self, n: int) -> np.ndarray:
         with self._lock:
             return self.buffer.latest(n)
 
     def stop(self) -> None:
-        self._running = False
+        self._stopped.set()
         if self._thread is not None:
             self._thread.join(timeout=1.0)
+        if self._dispatcher is not None:
+            # Give the dispatcher a moment to drain what the producer handed
+            # off; a long backlog keeps draining after this returns (the next
+            # start() waits for it).
+            self._wake.set()
+            self._dispatcher.join(timeout=1.0)
         self.device.stop()
         self.device.disconnect()
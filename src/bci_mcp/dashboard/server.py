@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import logging
 from collections.abc import Iterable
 from pathlib import Path
 from urllib.parse import urlsplit
@@ -11,12 +13,16 @@ from fastapi.responses import FileResponse, JSONResponse
 
 from ..pipeline import Pipeline
 
+logger = logging.getLogger(__name__)
+
 _STATIC = Path(__file__).parent / "static"
 
 # "testserver" is Starlette's TestClient default; single-label names are not
 # resolvable on the public internet, so allowing it does not weaken the check.
 _LOCAL_HOSTNAMES = frozenset({"127.0.0.1", "::1", "localhost", "testserver"})
 
+_WS_PERIOD = 0.25  # seconds between /ws frames
+
 
 def _hostname(host_header: str) -> str:
     """Hostname from a Host header value ('example.com:8000', '[::1]:8000')."""
@@ -59,6 +65,25 @@ def create_app(pipeline: Pipeline, *, extra_allowed_hosts: Iterable[str] = (),
         # A page legitimately served by this dashboard has Origin == Host.
         return origin_host in allowed_hosts or origin_host == _hostname(host_header)
 
+    # /ws fan-out: current_state() returns the same BrainState until new
+    # samples land, so each reading is serialized once and every open socket
+    # sends that same string. Per-tick work stays O(readings), not
+    # O(readings x dashboards). Swapped as one tuple so readers never pair a
+    # state with another state's frame.
+    frame_cache: tuple[object, str] = (None, "")
+
+    async def _frame() -> str:
+        nonlocal frame_cache
+        s = await asyncio.to_thread(pipeline.current_state)  # DSP off the event loop
+        cached_state, cached_frame = frame_cache
+        if s is not None and s is cached_state:
+            return cached_frame
+        frame = json.dumps(s.to_dict() if s is not None else {"status": "warming_up"},
+                           separators=(",", ":"), ensure_ascii=False)
+        if s is not None:
+            frame_cache = (s, frame)
+        return frame
+
     @app.middleware("http")
     async def _validate_host(request: Request, call_next):  # noqa: ANN001, ANN202
         if not _host_ok(request.headers.get("host", "")):
@@ -88,14 +113,40 @@ def create_app(pipeline: Pipeline, *, extra_allowed_hosts: Iterable[str] = (),
             await websocket.close(code=1008)  # policy violation
             return
         await websocket.accept()
+
+        async def _send_frames() -> None:
+            # Frames are built at send time, so a slow client never has a
+            # backlog of stale readings queued for it -- it gets the newest.
+            try:
+                while True:
+                    await websocket.send_text(await _frame())
+                    await asyncio.sleep(_WS_PERIOD)
+            except WebSocketDisconnect:
+                pass  # the receive loop below sees the close and ends the handler
+
+        async def _receive_until_closed() -> None:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+
+        # Sending and reading run as sibling tasks: a close is noticed right
+        # away -- even while the sender sleeps or is blocked on a slow socket
+        # -- and anything the client sends is drained instead of piling up.
+        # Whichever finishes first ends the connection, so a sender that
+        # fails cannot leave an open socket that never sends again.
+        sender = asyncio.create_task(_send_frames())
+        receiver = asyncio.create_task(_receive_until_closed())
         try:
-            while True:
-                s = pipeline.current_state()
-                await websocket.send_json(s.to_dict() if s is not None
-                                          else {"status": "warming_up"})
-                await asyncio.sleep(0.25)
-        except WebSocketDisconnect:
-            pass
+            done, _ = await asyncio.wait({sender, receiver},
+                                         return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sender.cancel()
+            receiver.cancel()
+            await asyncio.wait({sender, receiver})
+        if sender in done and not sender.cancelled() and sender.exception() is not None:
+            logger.error("Dashboard /ws sender failed; closing the socket",
+                         exc_info=sender.exception())
+            # 1011: internal error. The page sees onclose and falls back to polling.
+            await websocket.close(code=1011)
 
     return app
 
@@ -111,6 +162,9 @@ def serve_dashboard(device: str = "synthetic://", host: str = "127.0.0.1",
     else:
         app = create_app(pipeline, extra_allowed_hosts=(host,))
     try:
-        uvicorn.run(app, host=host, port=port)
+        # The /ws frames are small JSON snapshots sent several times a second;
+        # permessage-deflate would spend zlib CPU on every frame for little
+        # saving, and keeps a compression context per connection.
+        uvicorn.run(app, host=host, port=port, ws_per_message_deflate=False)
     finally:
         pipeline.stop()
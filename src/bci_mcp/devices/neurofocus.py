@@ -1,15 +1,23 @@
 """NeuroFocus v4 device — USB-serial and BLE transports."""
 from __future__ import annotations
 
+import logging
 import threading
 import time
+from collections import deque
 
 import numpy as np
 
-from ..core.device import Chunk, Device, DeviceInfo
+from ..core.device import Chunk, Device, DeviceInfo, backfilled_timestamps
 from ..core.registry import register
 from . import neurofocus_protocol as proto
 
+logger = logging.getLogger(__name__)
+
+_READ_BLOCK = 4096  # max bytes per read()
+_READ_TIMEOUT = 0.1  # s; port read timeout (as in serial_device)
+_MAX_PENDING_SECONDS = 60.0  # undrained samples kept if nobody calls read(); oldest dropped
+
 
 class NeuroFocusDevice(Device):
     def __init__(self, transport: str = "serial", port: str = "",
@@ -29,8 +37,16 @@ class NeuroFocusDevice(Device):
             sample_rate=sample_rate, channel_count=1, channel_names=["ch1"],
             units="uV", extra={"transport": transport},
         )
-        self._buf: list[float] = []
+        # Pending µV blocks, one per decoded frame. Bounded in samples (a
+        # binary batch frame carries up to 255) so a device left streaming with
+        # nobody calling read() drops the oldest samples instead of growing
+        # without limit.
+        self._buf: deque[np.ndarray] = deque()
+        self._pending = 0  # samples held in _buf
+        self._max_pending = max(1, int(sample_rate * _MAX_PENDING_SECONDS))
+        self._dropped = 0  # samples discarded by that bound
         self._lock = threading.Lock()
+        self._last_arrival = 0.0  # stamp for backfilled_timestamps()
         self._thread: threading.Thread | None = None
         self._running = False
         self._serial = None
@@ -41,20 +57,42 @@ class NeuroFocusDevice(Device):
 
     # --- shared ---
     def _emit_counts(self, counts) -> None:
-        if not counts:
+        if len(counts) == 0:
             return
-        uv = proto.counts_to_uv(np.asarray(counts, dtype=np.int64))
+        # Keep each frame as one float32 block instead of extending a list with
+        # per-sample Python floats; read() joins the blocks in a single copy.
+        uv = np.atleast_1d(proto.counts_to_uv(np.asarray(counts, dtype=np.int64)))
+        block = uv.astype(np.float32)
+        now = time.monotonic()
         with self._lock:
-            self._buf.extend(float(x) for x in np.atleast_1d(uv))
+            self._buf.append(block)
+            self._pending += len(block)
+            self._last_arrival = now
+            dropped_before = self._dropped
+            while self._pending > self._max_pending:
+                excess = self._pending - self._max_pending
+                oldest = self._buf[0]
+                if len(oldest) <= excess:
+                    self._buf.popleft()
+                    excess = len(oldest)
+                else:
+                    self._buf[0] = oldest[excess:]
+                self._pending -= excess
+                self._dropped += excess
+        if dropped_before == 0 and self._dropped:
+            logger.warning("%s: read() not called for %g s; dropping the oldest samples",
+                           self.info.name, _MAX_PENDING_SECONDS)
 
     def read(self) -> Chunk | None:
         with self._lock:
             if not self._buf:
                 return None
-            values = self._buf
-            self._buf = []
-        data = np.array(values, dtype=np.float32).reshape(1, -1)
-        ts = np.arange(data.shape[1], dtype=np.float64) / self.info.sample_rate
+            blocks = list(self._buf)
+            self._buf.clear()
+            self._pending = 0
+            last = self._last_arrival
+        data = np.concatenate(blocks).reshape(1, -1)
+        ts = backfilled_timestamps(last, data.shape[1], self.info.sample_rate)
         return Chunk(data=data, timestamps=ts)
 
     # --- lifecycle dispatch ---
@@ -115,18 +153,35 @@ class NeuroFocusDevice(Device):
         else:
             import serial
 
-            self._serial = serial.Serial(self.port, self.baud, timeout=1)
+            self._serial = serial.Serial(self.port, self.baud, timeout=_READ_TIMEOUT)
 
     def _run_serial(self) -> None:
+        # Same framing as SerialDevice._run: a timed-out read can end mid-line,
+        # so bytes accumulate in `pending` and only complete b"\n"-terminated
+        # frames are decoded.
+        pending = bytearray()
         while self._running and getattr(self._serial, "is_open", False):
             try:
-                if self._serial.in_waiting:
-                    line = self._serial.readline()
-                    self._emit_counts(proto.parse_frame(line))
-                else:
-                    time.sleep(0.001)
+                want = max(1, min(self._serial.in_waiting, _READ_BLOCK))
+                got = self._serial.read(want)
             except (OSError, AttributeError):
                 break
+            if not got:
+                continue
+            pending += got
+            cut = pending.rfind(b"\n")
+            if cut < 0:
+                if len(pending) > _READ_BLOCK:
+                    pending.clear()  # no frame boundary in a whole block: noise
+                continue
+            frames = pending[:cut].split(b"\n")
+            del pending[:cut + 1]
+            for frame in frames:
+                try:
+                    counts = proto.decode_frame(bytes(frame))
+                except (ValueError, IndexError):
+                    continue  # a short or corrupt binary batch
+                self._emit_counts(counts)
 
     # --- BLE transport (bleak 3.x API verified: find_device_by_name, start_notify(uuid, cb),
     #     callback signature (sender, data: bytearray)) ---
@@ -140,7 +195,7 @@ class NeuroFocusDevice(Device):
         self._ble_error = None
 
         def _notify(_sender, data) -> None:
-            self._emit_counts(proto.parse_frame(bytes(data)))
+            self._emit_counts(proto.decode_frame(bytes(data)))
 
         async def _setup() -> None:
             try:
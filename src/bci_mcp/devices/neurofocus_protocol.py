@@ -1,8 +1,6 @@
 """NeuroFocus v4 wire protocol — pure decode helpers (no I/O)."""
 from __future__ import annotations
 
-import struct
-
 import numpy as np
 
 SERVICE_UUID = "0338ff7c-6251-4029-a5d5-24e4fa856c8d"
@@ -26,24 +24,30 @@ def counts_to_uv(counts):
     )
 
 
-def parse_frame(payload: bytes) -> list[int]:
-    """Decode one BLE/serial payload into a list of raw ADC counts.
+def decode_frame(payload: bytes) -> np.ndarray:
+    """Decode one BLE/serial payload into an int64 array of raw ADC counts.
 
     Supports binary-batch frames (0xE7 0x1E magic) and ASCII decimal frames.
-    Returns [] for blank/unparseable ASCII.
+    A binary batch is decoded with a single ``np.frombuffer`` call rather than
+    one ``struct`` unpack per sample. Returns an empty array for blank or
+    unparseable ASCII.
     """
     if payload[:2] == _BINARY_MAGIC:
         n = payload[4]
-        offset = 5
-        out: list[int] = []
-        for i in range(n):
-            (value,) = struct.unpack_from("<i", payload, offset + i * 4)
-            out.append(value)
-        return out
+        return np.frombuffer(payload, dtype="<i4", count=n, offset=5).astype(np.int64)
     text = payload.decode("utf-8", errors="ignore").strip()
     if not text:
-        return []
+        return np.zeros(0, dtype=np.int64)
     try:
-        return [int(text)]
+        return np.array([int(text)], dtype=np.int64)
     except ValueError:
-        return []
+        return np.zeros(0, dtype=np.int64)
+
+
+def parse_frame(payload: bytes) -> list[int]:
+    """Decode one BLE/serial payload into a list of raw ADC counts.
+
+    List-returning wrapper around ``decode_frame``. Returns [] for
+    blank/unparseable ASCII.
+    """
+    return decode_frame(payload).tolist()
@@ -13,9 +13,13 @@ class PlaybackDevice(Device):
                  loop: bool = False, uri: str | None = None) -> None:
         rec = load_recording(recording) if isinstance(recording, str) else recording
         self._rec = rec
+        # Converted once, so each chunk is a contiguous slice copy rather than
+        # a per-read dtype conversion.
+        self._data = np.ascontiguousarray(rec.data, dtype=np.float32)
         self.chunk_samples = max(1, int(chunk_samples))
         self.loop = loop
         self._pos = 0
+        self._emitted = 0  # samples handed out since start(); drives timestamps
         self._streaming = False
         self.info = DeviceInfo(
             name="Playback", uri=uri or "playback://memory",
@@ -30,20 +34,33 @@ class PlaybackDevice(Device):
     def start(self) -> None:
         self._streaming = True
         self._pos = 0
+        self._emitted = 0
 
     def read(self) -> Chunk | None:
         if not self._streaming:
             return None
-        n_total = self._rec.data.shape[1]
-        if self._pos >= n_total:
-            if self.loop:
-                self._pos = 0
-            else:
-                return None
-        end = min(self._pos + self.chunk_samples, n_total)
-        data = self._rec.data[:, self._pos:end].astype(np.float32)
-        ts = np.arange(self._pos, end, dtype=np.float64) / self.info.sample_rate
-        self._pos = end
+        n_total = self._data.shape[1]
+        if self.loop and n_total:
+            # A looped read that runs past the end is split into contiguous
+            # spans (tail of the recording, then its head), so chunks keep a
+            # fixed size across the seam instead of coming up short each lap.
+            spans, left = [], self.chunk_samples
+            while left:
+                take = min(left, n_total - self._pos)
+                spans.append(self._data[:, self._pos:self._pos + take])
+                self._pos = (self._pos + take) % n_total
+                left -= take
+            data = spans[0].copy() if len(spans) == 1 else np.concatenate(spans, axis=1)
+        elif self._pos < n_total:
+            end = min(self._pos + self.chunk_samples, n_total)
+            data = self._data[:, self._pos:end].copy()
+            self._pos = end
+        else:
+            return None
+        # Timestamps count samples emitted, so they keep rising across loops.
+        n = data.shape[1]
+        ts = np.arange(self._emitted, self._emitted + n, dtype=np.float64) / self.info.sample_rate
+        self._emitted += n
         return Chunk(data=data, timestamps=ts)
 
     def stop(self) -> None:
@@ -1,14 +1,21 @@
 """Generic single-channel serial EEG device (one ASCII integer per line)."""
 from __future__ import annotations
 
+import logging
 import threading
 import time
 
 import numpy as np
 
-from ..core.device import Chunk, Device, DeviceInfo
+from ..core.device import Chunk, Device, DeviceInfo, backfilled_timestamps
 from ..core.registry import register
 
+logger = logging.getLogger(__name__)
+
+_READ_BLOCK = 4096  # max bytes per read(); ~2 s of ASCII samples at 250 Hz
+_READ_TIMEOUT = 0.1  # s; upper bound on a blocking read, and so on stop() latency
+_MAX_PENDING_SECONDS = 60.0  # undrained samples kept if nobody calls read(); oldest dropped
+
 
 class SerialDevice(Device):
     def __init__(self, port: str, baud: int = 115200, sample_rate: float = 250.0,
@@ -27,7 +34,10 @@ class SerialDevice(Device):
         self._serial_factory = serial_factory
         self._serial = None
         self._buf: list[float] = []
+        self._max_pending = max(1, int(sample_rate * _MAX_PENDING_SECONDS))
+        self._dropped = 0  # samples discarded by that bound
         self._lock = threading.Lock()
+        self._last_arrival = 0.0  # time.monotonic() when the newest pending sample landed
         self._thread: threading.Thread | None = None
         self._running = False
 
@@ -36,7 +46,7 @@ class SerialDevice(Device):
             return self._serial_factory(self.port, self.baud)
         import serial  # lazy: pyserial is an optional dependency
 
-        return serial.Serial(self.port, self.baud, timeout=1)
+        return serial.Serial(self.port, self.baud, timeout=_READ_TIMEOUT)
 
     def connect(self) -> None:
         self._serial = self._make_serial()
@@ -51,19 +61,44 @@ class SerialDevice(Device):
         self._thread.start()
 
     def _run(self) -> None:
+        # Drain what the OS has buffered in one read() per block instead of one
+        # readline() syscall per sample. pyserial's read() returns fresh bytes
+        # (its readinto() is just read() plus a copy), so the block is appended
+        # straight to the reused `pending` line buffer; a trailing partial line
+        # stays there until the next block completes it.
+        pending = bytearray()
         while self._running and getattr(self._serial, "is_open", False):
             try:
-                if self._serial.in_waiting:
-                    line = self._serial.readline().decode("utf-8", errors="ignore").strip()
-                    if line:
-                        try:
-                            value = int(line)
-                        except ValueError:
-                            continue
-                        with self._lock:
-                            self._buf.append(value * self.scale_uv)
-                else:
-                    time.sleep(0.001)
+                # Block in the driver for at least one byte instead of spinning
+                # on sleep(); the port's read timeout bounds the wait so stop()
+                # is still honoured promptly. Everything already buffered is
+                # drained in the same call.
+                want = max(1, min(self._serial.in_waiting, _READ_BLOCK))
+                got = self._serial.read(want)
+                if not got:
+                    continue
+                pending += got
+                cut = pending.rfind(b"\n")
+                if cut < 0:
+                    if len(pending) > _READ_BLOCK:
+                        # No newline in a whole block: wrong baud rate or line
+                        # noise. Discard it rather than grow without bound.
+                        pending.clear()
+                    continue
+                values = _parse_lines(pending[:cut].split(b"\n"))
+                del pending[:cut + 1]
+                if values:
+                    now = time.monotonic()
+                    with self._lock:
+                        self._buf.extend(v * self.scale_uv for v in values)
+                        excess = len(self._buf) - self._max_pending
+                        if excess > 0:
+                            del self._buf[:excess]
+                            self._dropped += excess
+                        self._last_arrival = now
+                    if excess > 0 and self._dropped == excess:
+                        logger.warning("%s: read() not called for %g s; dropping the "
+                                       "oldest samples", self.info.name, _MAX_PENDING_SECONDS)
             except (OSError, AttributeError):
                 break
 
@@ -73,8 +108,9 @@ class SerialDevice(Device):
                 return None
             values = self._buf
             self._buf = []
+            last = self._last_arrival
         data = np.array(values, dtype=np.float32).reshape(1, -1)
-        ts = np.arange(data.shape[1], dtype=np.float64) / self.info.sample_rate
+        ts = backfilled_timestamps(last, data.shape[1], self.info.sample_rate)
         return Chunk(data=data, timestamps=ts)
 
     def stop(self) -> None:
@@ -92,6 +128,17 @@ class SerialDevice(Device):
             self._serial.close()
 
 
+def _parse_lines(lines: list[bytearray]) -> list[int]:
+    """ASCII integers from complete lines; blank or garbled lines are skipped."""
+    values: list[int] = []
+    for line in lines:
+        try:
+            values.append(int(line))
+        except ValueError:
+            continue
+    return values
+
+
 def _factory(parsed, params):  # noqa: ANN001
     port = (parsed.netloc + parsed.path) or params.get("port", "")
     return SerialDevice(
@@ -27,6 +27,7 @@ class SyntheticDevice(Device):
             units="uV",
         )
         self.chunk_samples = chunk_samples
+        self._offsets = np.arange(chunk_samples, dtype=np.float64)  # reused every read
         self.focus = float(np.clip(focus, 0.0, 1.0))
         self._rng = np.random.default_rng(seed)
         self._t = 0  # sample counter
@@ -49,8 +50,9 @@ class SyntheticDevice(Device):
             return None
         fs = self.info.sample_rate
         n = self.chunk_samples
-        idx = self._t + np.arange(n)
-        t = idx / fs
+        if self._offsets.size != n:
+            self._offsets = np.arange(n, dtype=np.float64)
+        t = (self._t + self._offsets) / fs
         alpha_amp = 20.0 * (1.0 - self.focus) + 5.0  # 10 Hz
         beta_amp = 18.0 * self.focus + 3.0  # 20 Hz
         base = (
@@ -58,12 +60,13 @@ class SyntheticDevice(Device):
             + beta_amp * np.sin(2 * np.pi * 20 * t)
             + 8.0 * np.sin(2 * np.pi * 6 * t)  # theta
         )
-        data = np.empty((self.info.channel_count, n), dtype=np.float32)
-        for c in range(self.info.channel_count):
-            noise = self._rng.normal(0.0, 5.0, n)
-            data[c] = base + noise
+        # One (channels, n) draw is the same row-major stream as one draw per
+        # channel, so seeded output is unchanged; the add broadcasts base over
+        # every channel in a single pass.
+        noise = self._rng.normal(0.0, 5.0, (self.info.channel_count, n))
+        data = (noise + base).astype(np.float32)
         self._t += n
-        return Chunk(data=data, timestamps=t.astype(np.float64))
+        return Chunk(data=data, timestamps=t)  # t is float64 and fresh per read
 
 
 def _factory(parsed, params):  # noqa: ANN001
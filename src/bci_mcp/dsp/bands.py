@@ -17,6 +17,8 @@ Two practical details handled here:
 """
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.integrate import trapezoid
 from scipy.signal import welch
@@ -47,19 +49,34 @@ def band_powers(data: np.ndarray, fs: float, nperseg: int | None = None) -> dict
     psd = np.atleast_2d(psd)
     df = float(freqs[1] - freqs[0]) if len(freqs) > 1 else 1.0
     out: dict[str, float] = {}
-    for band, (lo, hi) in BANDS.items():
-        mask = (freqs >= lo) & (freqs < hi)
-        nbins = int(np.count_nonzero(mask))
-        if nbins == 0:
+    for band, bins in _band_bins(float(fs), nperseg):
+        nbins = bins.stop - bins.start
+        if nbins <= 0:
             out[band] = 0.0
         elif nbins == 1:
             # trapezoid over a single sample is 0 — use rectangular integration.
-            out[band] = float(np.mean(psd[:, mask].sum(axis=-1)) * df)
+            out[band] = float(np.mean(psd[:, bins].sum(axis=-1)) * df)
         else:
-            out[band] = float(np.mean(trapezoid(psd[:, mask], freqs[mask], axis=-1)))
+            out[band] = float(np.mean(trapezoid(psd[:, bins], freqs[bins], axis=-1)))
     return out
 
 
+@lru_cache(maxsize=32)
+def _band_bins(fs: float, nperseg: int) -> tuple[tuple[str, slice], ...]:
+    """Welch bins covering each band ``[lo, hi)``, as contiguous slices.
+
+    The Welch frequency grid depends only on ``fs`` and ``nperseg``, and
+    ``BANDS`` is constant, so the band edges are resolved once per setting
+    instead of building five boolean masks (and fancy-indexed copies) per call.
+    """
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / fs)
+    return tuple(
+        (band, slice(int(np.searchsorted(freqs, lo, side="left")),
+                     int(np.searchsorted(freqs, hi, side="left"))))
+        for band, (lo, hi) in BANDS.items()
+    )
+
+
 def relative_band_powers(bp: dict[str, float]) -> dict[str, float]:
     total = sum(bp.values()) or 1.0
     return {k: v / total for k, v in bp.items()}
@@ -55,13 +55,14 @@ class Calibration:
     ) -> Calibration:
         if not raw_list:
             raise ValueError("from_samples requires at least one sample")
-        keys = raw_list[0].keys()
+        keys = list(raw_list[0])
+        # One (samples, metrics) matrix, reduced column-wise in a single pass
+        # each, instead of rebuilding a per-metric list twice per key.
+        values = np.array([[r[k] for k in keys] for r in raw_list], dtype=np.float64)
+        means, stds = values.mean(axis=0), values.std(axis=0)
         baseline = {
-            k: {
-                "mean": float(np.mean([r[k] for r in raw_list])),
-                "std": float(np.std([r[k] for r in raw_list])),
-            }
-            for k in keys
+            k: {"mean": float(m), "std": float(sd)}
+            for k, m, sd in zip(keys, means, stds, strict=True)
         }
         for k, stats in baseline.items():
             if stats["std"] == 0.0:
@@ -1,19 +1,71 @@
-"""Zero-phase EEG filters (operate along the last axis: (channels, n_samples))."""
+"""Zero-phase EEG filters (operate along the last axis: (channels, n_samples)).
+
+Both filters run as cascaded second-order sections (SOS / biquads) rather than
+a single high-order ``(b, a)`` transfer function: an order-4 bandpass with a
+1 Hz low edge has poles close to the unit circle, where the polynomial form
+loses precision, while each biquad stays well-conditioned.
+
+Coefficient design depends only on the sample rate and band edges, so it is
+cached: the pipeline re-filters a fresh window several times a second at the
+same settings and should not re-solve the Butterworth design each time.
+
+These are offline filters: ``sosfiltfilt`` runs forward and backward, so it is
+non-causal and needs the whole segment up front. The pipeline applies them to
+a complete analysis window (or a saved recording), never chunk by chunk inside
+``Stream`` -- filtering successive chunks independently would restart the
+filter state at every boundary. A live, per-chunk filter would have to be a
+causal ``sosfilt`` carrying its ``zi`` state between calls.
+"""
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
-from scipy.signal import butter, filtfilt, iirnotch
+from scipy.signal import butter, iirnotch, sosfiltfilt, tf2sos
+
+
+@lru_cache(maxsize=32)
+def _bandpass_sos(fs: float, low: float, high: float, order: int) -> np.ndarray:
+    nyq = 0.5 * fs
+    # The returned array is shared through the cache; callers must not mutate
+    # it (scipy's sosfilt needs a writable buffer, so it is not frozen).
+    return butter(order, [low / nyq, min(high, nyq - 1) / nyq], btype="band", output="sos")
+
+
+@lru_cache(maxsize=32)
+def _notch_sos(fs: float, freq: float, q: float) -> np.ndarray:
+    return tf2sos(*iirnotch(freq / (0.5 * fs), q))
 
 
 def bandpass(data: np.ndarray, fs: float, low: float = 1.0, high: float = 45.0,
              order: int = 4) -> np.ndarray:
-    nyq = 0.5 * fs
-    b, a = butter(order, [low / nyq, min(high, nyq - 1) / nyq], btype="band")
-    return filtfilt(b, a, data, axis=-1)
+    sos = _bandpass_sos(float(fs), float(low), float(high), int(order))
+    return sosfiltfilt(sos, data, axis=-1)
 
 
 def notch(data: np.ndarray, fs: float, freq: float = 60.0, q: float = 30.0) -> np.ndarray:
     if freq >= 0.5 * fs:
         return data
-    b, a = iirnotch(freq / (0.5 * fs), q)
-    return filtfilt(b, a, data, axis=-1)
+    return sosfiltfilt(_notch_sos(float(fs), float(freq), float(q)), data, axis=-1)
+
+
+@lru_cache(maxsize=32)
+def _notch_bandpass_sos(fs: float, freq: float, q: float, low: float, high: float,
+                        order: int) -> np.ndarray:
+    sections = [_bandpass_sos(fs, low, high, order)]
+    if freq < 0.5 * fs:
+        sections.insert(0, _notch_sos(fs, freq, q))
+    return np.vstack(sections)
+
+
+def notch_bandpass(data: np.ndarray, fs: float, freq: float = 60.0, q: float = 30.0,
+                   low: float = 1.0, high: float = 45.0, order: int = 4) -> np.ndarray:
+    """``notch`` then ``bandpass`` as one cascaded SOS, in a single zero-phase pass.
+
+    The notch sections come first in the cascade. Equivalent to calling the
+    two filters in sequence (up to edge padding) but walks the data once in
+    each direction instead of twice.
+    """
+    sos = _notch_bandpass_sos(float(fs), float(freq), float(q), float(low), float(high),
+                              int(order))
+    return sosfiltfilt(sos, data, axis=-1)
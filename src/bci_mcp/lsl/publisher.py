@@ -26,7 +26,10 @@ class LSLPublisher:
         """data: (channels, n_samples) -> pushed as n_samples rows of channels."""
         if self._raw_outlet is None:
             return
-        self._raw_outlet.push_chunk(data.T.astype(np.float32).tolist())
+        # A C-contiguous float32 (n_samples, channels) array matches the
+        # outlet's channel format, so pylsl hands the raw buffer to liblsl in
+        # one call instead of converting every sample to a Python float.
+        self._raw_outlet.push_chunk(np.ascontiguousarray(data.T, dtype=np.float32))
 
     def publish_metrics(self, metrics: dict) -> None:
         from pylsl import StreamInfo, StreamOutlet
@@ -11,6 +11,18 @@ import os
 
 _EXEMPT_PATHS = frozenset({"/health"})
 
+# The rejection is identical every time, so its ASGI messages are built once
+# (ASGI servers only read these; they are never mutated).
+_UNAUTHORIZED_BODY = b'{"error": "unauthorized"}'
+_UNAUTHORIZED_START = {
+    "type": "http.response.start",
+    "status": 401,
+    "headers": [(b"content-type", b"application/json"),
+                (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode()),
+                (b"www-authenticate", b"Bearer")],
+}
+_UNAUTHORIZED_END = {"type": "http.response.body", "body": _UNAUTHORIZED_BODY}
+
 
 def configured_token() -> str | None:
     """The shared secret from the environment, or None when auth is disabled."""
@@ -47,11 +59,5 @@ class TokenAuthMiddleware:
                 credential.strip(), token):
             await self.app(scope, receive, send)
             return
-        await send({
-            "type": "http.response.start",
-            "status": 401,
-            "headers": [(b"content-type", b"application/json"),
-                        (b"www-authenticate", b"Bearer")],
-        })
-        await send({"type": "http.response.body",
-                    "body": b'{"error": "unauthorized"}'})
+        await send(_UNAUTHORIZED_START)
+        await send(_UNAUTHORIZED_END)
@@ -1,6 +1,8 @@
 """Real Model Context Protocol server exposing live brain state."""
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
 import os
 
@@ -12,6 +14,8 @@ from starlette.responses import JSONResponse
 from .auth import TokenAuthMiddleware, configured_token
 from .service import BrainService
 
+logger = logging.getLogger(__name__)
+
 _LOOPBACK_HOSTS = {"127.0.0.1", "localhost", "::1"}
 
 
@@ -25,6 +29,10 @@ def _listen_port() -> int:
     return int(os.environ.get("FASTMCP_PORT", os.environ.get("PORT", "8000")))
 
 
+def _uvloop_available() -> bool:
+    return importlib.util.find_spec("uvloop") is not None
+
+
 def _stateless_http() -> bool:
     flag = os.environ.get("FASTMCP_STATELESS_HTTP", "").lower()
     return flag in {"1", "true", "yes"} or os.environ.get("MCP_ENV") == "production"
@@ -62,21 +70,28 @@ _service = BrainService()
 
 
 @mcp.tool()
-def list_devices() -> dict:
+async def list_devices() -> dict:
     """List EEG devices/URIs you can connect to."""
-    return _service.list_devices()
+    # Discovery enumerates serial ports (blocking OS calls on a cache miss);
+    # run it on a worker thread so it never stalls the event loop.
+    return await asyncio.to_thread(_service.list_devices)
+
+
+# Tools that block (device I/O, or sleeping for the whole capture window)
+# run on a worker thread: FastMCP calls sync tools inline on the event loop,
+# so a 20 s calibrate would otherwise stall every other request for 20 s.
 
 
 @mcp.tool()
-def connect(device_uri: str = "synthetic://") -> dict:
+async def connect(device_uri: str = "synthetic://") -> dict:
     """Connect to an EEG device and start streaming. Default is the synthetic brain."""
-    return _service.connect(device_uri)
+    return await asyncio.to_thread(_service.connect, device_uri)
 
 
 @mcp.tool()
-def disconnect() -> dict:
+async def disconnect() -> dict:
     """Disconnect from the current EEG device."""
-    return _service.disconnect()
+    return await asyncio.to_thread(_service.disconnect)
 
 
 @mcp.tool()
@@ -86,7 +101,9 @@ def get_brain_state() -> dict:
     signal quality. Each reading carries `confidence` (0..1), per-metric
     `metric_confidence`, and a `status` ('ok'/'warming_up'/'unreliable') — weight
     the metrics by these and do not interpret an unreliable/low-confidence
-    reading. Call get_metric_definitions to learn what each metric means."""
+    reading. Call get_metric_definitions to learn what each metric means.
+    This one reading already includes everything get_band_powers and
+    get_signal_quality return, so call it once rather than all three."""
     return _service.get_brain_state()
 
 
@@ -124,9 +141,9 @@ def get_pipeline_limitations() -> dict:
 
 
 @mcp.tool()
-def calibrate(seconds: int = 20, condition: str = "relax") -> dict:
+async def calibrate(seconds: int = 20, condition: str = "relax") -> dict:
     """Capture a baseline so focus/calm/etc. are personalized to the wearer."""
-    return _service.calibrate(seconds, condition)
+    return await asyncio.to_thread(_service.calibrate, seconds, condition)
 
 
 @mcp.tool()
@@ -152,7 +169,9 @@ def brain_state_resource() -> str:
 @mcp.resource("brain://device")
 def brain_device_resource() -> str:
     """Information about the connected device."""
-    return str(_service.list_devices())
+    # Reads the live connection instead of re-running device discovery
+    # (a serial port scan) on every resource read.
+    return str(_service.device_info())
 
 
 @mcp.prompt()
@@ -175,9 +194,10 @@ def interpret_brain_state() -> str:
 
 
 @mcp.tool()
-def record(seconds: float = 10.0, path: str = "session.npz", fmt: str | None = None) -> dict:
+async def record(seconds: float = 10.0, path: str = "session.npz",
+                 fmt: str | None = None) -> dict:
     """Record the live stream for N seconds to a file (npz/csv/edf)."""
-    return _service.record(seconds, path, fmt)
+    return await asyncio.to_thread(_service.record, seconds, path, fmt)
 
 
 @mcp.tool()
@@ -206,7 +226,7 @@ def serve(transport: str = "stdio") -> None:
         import uvicorn
 
         if mcp.settings.host not in _LOOPBACK_HOSTS and configured_token() is None:
-            logging.getLogger(__name__).warning(
+            logger.warning(
                 "Serving MCP over HTTP on %s with no authentication — anyone who "
                 "can reach this host can read brain state and record EEG data. "
                 "Set MCP_AUTH_TOKEN to require a bearer token.",
@@ -220,4 +240,12 @@ def serve(transport: str = "stdio") -> None:
             log_level=mcp.settings.log_level.lower(),
         )
         return
+    if transport == "stdio":
+        import anyio
+
+        # uvloop (when installed) replaces the selector loop's Python-level
+        # I/O path; uvicorn already picks it up on its own for HTTP.
+        anyio.run(mcp.run_stdio_async,
+                  backend_options={"use_uvloop": _uvloop_available()})
+        return
     mcp.run(transport=transport)
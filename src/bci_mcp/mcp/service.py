@@ -5,18 +5,21 @@ import math
 import threading
 import time
 from collections import deque
+from functools import lru_cache
 
 from ..pipeline import Pipeline
 from ..recording.paths import safe_record_path, validate_mcp_uri
 
 # Untrusted MCP clients drive this service, so every argument is bounded:
-# durations are capped (the singleton blocks while recording/calibrating),
+# durations are capped and only one capture runs at a time (a record or
+# calibrate call holds a worker thread for its whole duration),
 # stored labels/events are capped (memory), and formats are allow-listed.
 MAX_RECORD_SECONDS = 3600.0
 MAX_CALIBRATE_SECONDS = 300.0
 MAX_LABEL_CHARS = 512
 MAX_EVENTS = 1000
 RECORD_FORMATS = ("npz", "csv", "edf")
+CAPTURE_BUSY = "a recording/calibration is already running"
 
 
 def _seconds_error(seconds: object, maximum: float) -> str | None:
@@ -31,12 +34,46 @@ def _seconds_error(seconds: object, maximum: float) -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
+def _metric_definitions() -> dict:
+    """The get_metric_definitions payload, built once.
+
+    Everything in it is static module data, so rebuilding the nested dict on
+    every call is wasted work. The cached dict is shared: treat it as read-only.
+    """
+    from ..dsp.limitations import pipeline_limitations
+    from ..dsp.metrics import METRIC_INFO
+
+    info = pipeline_limitations()
+    return {
+        "metrics": METRIC_INFO,
+        "method": info["method"],
+        "limitations": info["limitations"],
+        "intended_use": info["intended_use"],
+        "disclaimer": (
+            "These are heuristic EEG band-power ratios, not validated "
+            "clinical measurements. Weight them by the `confidence` and "
+            "`metric_confidence` fields, treat `status` == 'unreliable' as "
+            "untrustworthy, and calibrate for personalized 0-1 scaling. See "
+            "`limitations` for what this pipeline cannot do (e.g. it averages "
+            "transients out and is not a clinical/qEEG tool)."
+        ),
+    }
+
+
 class BrainService:
     def __init__(self) -> None:
         self._pipeline: Pipeline | None = None
         self._events: deque[dict] = deque(maxlen=MAX_EVENTS)
         self._nf = None
         self._lock = threading.Lock()
+        # Held for the whole of a record/calibrate call. Acquired without
+        # blocking, so a second capture is refused instead of queueing another
+        # long job on the shared worker pool.
+        self._capture = threading.Lock()
+        # (pipeline, payload) for device_info(). Keyed on the pipeline object,
+        # which connect()/disconnect() replace, so it can never go stale.
+        self._device_info: tuple[Pipeline, dict] | None = None
 
     def list_devices(self) -> dict:
         from ..core.registry import discover, list_schemes
@@ -70,10 +107,27 @@ class BrainService:
             self._nf = None
             return {"connected": False}
 
+    def device_info(self) -> dict:
+        """The connected device's fixed description, built once per connection."""
+        pipeline = self._pipeline
+        if pipeline is None:
+            return {"connected": False,
+                    "hint": "call connect(); list_devices shows what is available"}
+        cached = self._device_info
+        if cached is not None and cached[0] is pipeline:
+            return cached[1]
+        info = pipeline.device.info
+        payload = {"connected": True, "name": info.name, "uri": info.uri,
+                   "sample_rate": info.sample_rate, "channel_count": info.channel_count,
+                   "channel_names": list(info.channel_names), "units": info.units}
+        self._device_info = (pipeline, payload)
+        return payload
+
     def get_brain_state(self) -> dict:
-        if self._pipeline is None:
+        pipeline = self._pipeline
+        if pipeline is None:
             return {"error": "not connected — call connect() first"}
-        state = self._pipeline.current_state()
+        state = pipeline.current_state()
         if state is None:
             return {"status": "warming_up"}
         from ..dsp.limitations import SHORT_DISCLAIMER
@@ -103,24 +157,7 @@ class BrainService:
                 "status": state["status"]}
 
     def get_metric_definitions(self) -> dict:
-        from ..dsp.limitations import pipeline_limitations
-        from ..dsp.metrics import METRIC_INFO
-
-        info = pipeline_limitations()
-        return {
-            "metrics": METRIC_INFO,
-            "method": info["method"],
-            "limitations": info["limitations"],
-            "intended_use": info["intended_use"],
-            "disclaimer": (
-                "These are heuristic EEG band-power ratios, not validated "
-                "clinical measurements. Weight them by the `confidence` and "
-                "`metric_confidence` fields, treat `status` == 'unreliable' as "
-                "untrustworthy, and calibrate for personalized 0-1 scaling. See "
-                "`limitations` for what this pipeline cannot do (e.g. it averages "
-                "transients out and is not a clinical/qEEG tool)."
-            ),
-        }
+        return _metric_definitions()
 
     def get_pipeline_limitations(self) -> dict:
         """What the pipeline is and is not — method, limits, intended use."""
@@ -129,14 +166,24 @@ class BrainService:
         return pipeline_limitations()
 
     def calibrate(self, seconds: int = 20, condition: str = "relax") -> dict:
-        if self._pipeline is None:
+        # Read the pipeline once: blocking tools run on worker threads, so a
+        # concurrent disconnect() may clear the attribute mid-call.
+        pipeline = self._pipeline
+        if pipeline is None:
             return {"error": "not connected"}
         err = _seconds_error(seconds, MAX_CALIBRATE_SECONDS)
         if err is not None:
             return {"error": err}
         if len(condition) > MAX_LABEL_CHARS:
             return {"error": f"condition must be <= {MAX_LABEL_CHARS} characters"}
-        cal = self._pipeline.calibrate(seconds=float(seconds))
+        if not self._capture.acquire(blocking=False):
+            return {"error": CAPTURE_BUSY}
+        try:
+            cal = pipeline.calibrate(seconds=float(seconds))
+        finally:
+            self._capture.release()
+        if self._pipeline is not pipeline:
+            return {"error": "device was disconnected during calibration"}
         return {"calibrated": cal.calibrated, "condition": condition,
                 "metrics": list(cal.baseline)}
 
@@ -160,7 +207,8 @@ class BrainService:
 
     def record(self, seconds: float = 10.0, path: str = "session.npz",
                fmt: str | None = None) -> dict:
-        if self._pipeline is None:
+        pipeline = self._pipeline
+        if pipeline is None:
             return {"error": "not connected"}
         err = _seconds_error(seconds, MAX_RECORD_SECONDS)
         if err is not None:
@@ -173,10 +221,17 @@ class BrainService:
             safe_path = safe_record_path(path)
         except ValueError as exc:
             return {"error": str(exc)}
+        if not self._capture.acquire(blocking=False):
+            return {"error": CAPTURE_BUSY}
         try:
-            out = self._pipeline.record(seconds=float(seconds), path=safe_path, fmt=fmt)
+            out = pipeline.record(seconds=float(seconds), path=safe_path, fmt=fmt)
         except Exception as exc:  # e.g. missing optional writer backend (pyedflib)
             return {"error": f"recording failed: {exc}"}
+        finally:
+            self._capture.release()
+        if self._pipeline is not pipeline:
+            # The stream stopped early, so the file is shorter than requested.
+            return {"error": "device was disconnected during recording", "path": out}
         return {"recorded": True, "path": out, "seconds": float(seconds)}
 
     def start_neurofeedback(self, metric: str = "focus", target: float = 0.7) -> dict:
@@ -19,14 +19,20 @@ class NeurofeedbackSession:
         self.pipeline = pipeline
         self.metric = metric
         self.target = target
-        self._values: list[float] = []
+        # Running aggregates instead of a per-sample history: a session polled
+        # for hours stays O(1) in memory and score()/summary() stay O(1).
+        self._samples = 0
+        self._sum = 0.0
+        self._current: float | None = None
         self._in_zone = 0
         self._streak = 0
         self._best_streak = 0
         self._last_in_zone = False
 
     def start(self) -> None:
-        self._values.clear()
+        self._samples = 0
+        self._sum = 0.0
+        self._current = None
         self._in_zone = 0
         self._streak = 0
         self._best_streak = 0
@@ -37,7 +43,9 @@ class NeurofeedbackSession:
         if state is None or self.metric not in state.metrics:
             return None
         value = float(state.metrics[self.metric])
-        self._values.append(value)
+        self._samples += 1
+        self._sum += value
+        self._current = value
         if value >= self.target:
             self._in_zone += 1
             self._streak += 1
@@ -49,21 +57,21 @@ class NeurofeedbackSession:
         return value
 
     def score(self) -> dict:
-        n = len(self._values)
+        n = self._samples
         return {
             "metric": self.metric,
             "target": self.target,
-            "current": self._values[-1] if self._values else None,
+            "current": self._current,
             "in_zone": self._last_in_zone,
             "cumulative_in_zone_pct": (100.0 * self._in_zone / n) if n else 0.0,
             "samples": n,
         }
 
     def summary(self) -> NeurofeedbackSummary:
-        n = len(self._values)
+        n = self._samples
         return NeurofeedbackSummary(
             metric=self.metric, target=self.target, samples=n,
             time_in_zone_pct=(100.0 * self._in_zone / n) if n else 0.0,
-            mean_score=(sum(self._values) / n) if n else 0.0,
+            mean_score=(self._sum / n) if n else 0.0,
             best_streak=self._best_streak,
         )
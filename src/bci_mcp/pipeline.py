@@ -1,6 +1,7 @@
 """Pipeline: ties a Device/Stream to the DSP chain and emits BrainState."""
 from __future__ import annotations
 
+import logging
 import time
 
 from .core.device import Device
@@ -12,6 +13,12 @@ from .dsp import quality as quality_mod
 from .dsp.calibration import Calibration
 from .dsp.state import BrainState
 
+logger = logging.getLogger(__name__)
+
+# How long record() waits after the session for lagging consumers to be
+# handed its last chunk before saving what arrived.
+_DELIVERY_GRACE = 5.0
+
 
 class Pipeline:
     def __init__(self, device: Device | str, window_seconds: float = 2.0,
@@ -24,6 +31,10 @@ class Pipeline:
         self.window = int(self.device.info.sample_rate * window_seconds)
         self.notch_freq = notch_freq
         self.calibration = Calibration(scaling=metrics_mod.DEFAULT_SCALING)
+        # (samples_written, calibration, notch_freq) -> BrainState of the last
+        # reading. Swapped as one tuple so concurrent readers never see a key
+        # paired with another key's state.
+        self._cached: tuple[tuple, BrainState] | None = None
 
     def start(self) -> None:
         self.stream.start()
@@ -37,9 +48,8 @@ class Pipeline:
         if data.shape[1] < max(int(fs * 0.5), 64):
             return None, None, data, fs
         # Notch first (remove line noise before it can fold into the passband),
-        # then bandpass to the 1-45 Hz analysis range.
-        filtered = filters.notch(data, fs, self.notch_freq)
-        filtered = filters.bandpass(filtered, fs)
+        # then bandpass to the 1-45 Hz analysis range — one cascaded SOS pass.
+        filtered = filters.notch_bandpass(data, fs, self.notch_freq)
         bp = bands.band_powers(filtered, fs)
         return metrics_mod.raw_metrics(bp), bp, data, fs
 
@@ -50,6 +60,19 @@ class Pipeline:
         return float(max(0.0, min(1.0, quality_score * cal_factor * fill)))
 
     def current_state(self) -> BrainState | None:
+        """The reading for the newest window.
+
+        The CLI, dashboard (REST and every WebSocket), MCP tools and
+        neurofeedback all poll this, often faster than new samples arrive.
+        A reading is a pure function of the buffered samples and the
+        calibration, so it is computed once per batch of new samples and the
+        same ``BrainState`` is returned until more data lands. Treat it as
+        read-only.
+        """
+        key = (self.stream.samples_written, self.calibration, self.notch_freq)
+        cached = self._cached
+        if cached is not None and cached[0] == key:
+            return cached[1]
         raw, bp, data, fs = self._raw_metrics_now()
         if raw is None:
             return None
@@ -64,7 +87,7 @@ class Pipeline:
         if status == "unreliable":
             confidence = min(confidence, 0.1)
         confidence = round(confidence, 4)
-        return BrainState(
+        state = BrainState(
             timestamp=time.time(),
             metrics=scaled,
             band_powers=bp,
@@ -79,6 +102,8 @@ class Pipeline:
             metric_confidence={k: confidence for k in scaled},
             status=status,
         )
+        self._cached = (key, state)
+        return state
 
     def calibrate(self, seconds: float = 20.0) -> Calibration:
         samples = []
@@ -97,16 +122,37 @@ class Pipeline:
         from .recording.recorder import Recorder
         from .recording.writer import save_recording
 
-        recorder = Recorder()
+        # Size the log for the whole session up front so it never regrows.
+        recorder = Recorder(expected_samples=int(seconds * self.device.info.sample_rate) + 1024)
+        dropped_before = self.stream.dropped_chunks
         self.stream.add_consumer(recorder)
-        recorder.start()
+        # The session is a range of stream sample indices, not of delivery
+        # time: consumers lag acquisition, so chunks already queued belong
+        # before it and the last ones arrive after the sleep ends.
+        start = self.stream.samples_written
+        recorder.start(first_sample=start)
         try:
             time.sleep(seconds)
         finally:
+            end = self.stream.samples_written
+            recorder.stop(end_sample=end)
+            self.stream.wait_delivered(end, timeout=_DELIVERY_GRACE)
             recorder.stop()
             self.stream.remove_consumer(recorder)
         data = recorder.data()
+        metadata = {"device": self.device.info.name, "uri": self.device.info.uri}
+        # The log is gapless by construction, so samples the stream dropped
+        # while consumers lagged (or that were still queued after the grace
+        # period) would vanish without a trace; record them.
+        dropped = self.stream.dropped_chunks - dropped_before
+        missing = (end - start) - data.shape[1]
+        if missing:
+            logger.warning("Recording to %s is missing %d of %d samples; the saved "
+                           "samples are not continuous", path, missing, end - start)
+            metadata["missing_samples"] = missing
+        if dropped:
+            metadata["dropped_chunks"] = dropped
         return save_recording(
             data, self.device.info.sample_rate, self.device.info.channel_names, path, fmt,
-            metadata={"device": self.device.info.name, "uri": self.device.info.uri},
+            metadata=metadata,
         )
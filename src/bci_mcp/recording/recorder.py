@@ -7,21 +7,67 @@ from ..core.device import Chunk
 
 
 class Recorder:
-    def __init__(self) -> None:
-        self._chunks: list[np.ndarray] = []
+    """Append-only float32 log of every chunk seen while active.
+
+    Chunks are copied straight into one preallocated ``(channels, capacity)``
+    array that doubles when full (amortized O(1) per sample), so the recording
+    is never held twice as a list of chunks plus their concatenation.
+    ``expected_samples`` sizes the first allocation; a caller that knows the
+    session length can avoid regrowth entirely.
+
+    Stream consumers run behind acquisition, so wall-clock start/stop would
+    catch stale backlog and miss the tail. ``start``/``stop`` therefore take
+    optional stream sample indices (``Chunk.first_sample``): only samples in
+    ``[first_sample, end_sample)`` are kept, whenever they are delivered.
+    """
+
+    def __init__(self, expected_samples: int = 4096) -> None:
+        self._expected = max(1, int(expected_samples))
+        self._log: np.ndarray | None = None
+        self._n = 0
         self._active = False
+        self._from: int | None = None
+        self._until: int | None = None
 
-    def start(self) -> None:
+    def start(self, first_sample: int | None = None) -> None:
+        self._from = first_sample
         self._active = True
 
-    def stop(self) -> None:
-        self._active = False
+    def stop(self, end_sample: int | None = None) -> None:
+        """Stop now, or — given *end_sample* — once the stream passes that index."""
+        if end_sample is None:
+            self._active = False
+        else:
+            self._until = end_sample
 
     def __call__(self, chunk: Chunk) -> None:
-        if self._active:
-            self._chunks.append(chunk.data.copy())
+        if not self._active:
+            return
+        data = chunk.data
+        first = chunk.first_sample
+        if first is not None:
+            lo = 0 if self._from is None else max(0, self._from - first)
+            hi = data.shape[1] if self._until is None else min(data.shape[1], self._until - first)
+            if lo >= hi:
+                return
+            data = data[:, lo:hi]
+        elif self._until is not None:
+            return
+        channels, k = data.shape
+        end = self._n + k
+        if self._log is None:
+            self._log = np.empty((channels, max(self._expected, k)), dtype=np.float32)
+        elif end > self._log.shape[1]:
+            grown = np.empty((channels, max(2 * self._log.shape[1], end)), dtype=np.float32)
+            grown[:, : self._n] = self._log[:, : self._n]
+            self._log = grown
+        # Downcast at the source: a device handing over float64 would
+        # otherwise double the memory held for a long recording.
+        self._log[:, self._n:end] = data
+        self._n = end
 
     def data(self) -> np.ndarray:
-        if not self._chunks:
+        """The recorded samples, ``(channels, n)`` float32 (a view of the log)."""
+        if self._log is None:
             return np.zeros((0, 0), dtype=np.float32)
-        return np.concatenate(self._chunks, axis=1)
+        return self._log[:, : self._n]
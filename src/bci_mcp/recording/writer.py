@@ -5,47 +5,73 @@ import json
 
 import numpy as np
 
+_CSV_BLOCK = 65_536  # samples formatted per savetxt call (bounds the temporary table)
+
+
+def _save_npz(data: np.ndarray, sample_rate: float, channel_names: list[str], path: str,
+              metadata: dict) -> str:
+    if not path.endswith(".npz"):
+        path = path + ".npz"
+    np.savez(path, data=np.asarray(data, dtype=np.float32),
+             sample_rate=float(sample_rate),
+             channel_names=np.array(channel_names), metadata=json.dumps(metadata))
+    return path
+
+
+def _save_csv(data: np.ndarray, sample_rate: float, channel_names: list[str], path: str,
+              metadata: dict) -> str:
+    n = data.shape[1]
+    # Vectorized savetxt instead of a csv.writer row per sample, over
+    # bounded blocks so the float64 (timestamp + channels) table never
+    # exists for the whole recording at once. %.9g round-trips float32
+    # exactly; timestamps keep µs resolution for hour-long sessions.
+    row_fmt = ["%.12g"] + ["%.9g"] * data.shape[0]
+    with open(path, "w") as f:
+        f.write(",".join(["timestamp", *channel_names]) + "\n")
+        for start in range(0, n, _CSV_BLOCK):
+            stop = min(start + _CSV_BLOCK, n)
+            t = np.arange(start, stop, dtype=np.float64)
+            if sample_rate:
+                t /= sample_rate
+            np.savetxt(f, np.column_stack([t, data[:, start:stop].T]), fmt=row_fmt,
+                       delimiter=",")
+    return path
+
+
+def _save_edf(data: np.ndarray, sample_rate: float, channel_names: list[str], path: str,
+              metadata: dict) -> str:
+    import pyedflib
+
+    n_ch = data.shape[0]
+    writer = pyedflib.EdfWriter(path, n_ch, file_type=pyedflib.FILETYPE_EDFPLUS)
+    try:
+        headers = []
+        for i in range(n_ch):
+            ch = data[i]
+            headers.append({
+                "label": channel_names[i], "dimension": "uV",
+                "sample_frequency": float(sample_rate),
+                "physical_min": float(min(ch.min(), -1.0)),
+                "physical_max": float(max(ch.max(), 1.0)),
+                "digital_min": -32768, "digital_max": 32767,
+                "transducer": "", "prefilter": "",
+            })
+        writer.setSignalHeaders(headers)
+        writer.writeSamples([data[i].astype(np.float64) for i in range(n_ch)])
+    finally:
+        writer.close()
+    return path
+
+
+# Format -> writer. One table lookup instead of an if/elif chain, and the
+# single place a new format is registered.
+_WRITERS = {"npz": _save_npz, "csv": _save_csv, "edf": _save_edf}
+
 
 def save_recording(data: np.ndarray, sample_rate: float, channel_names: list[str],
                    path: str, fmt: str | None = None, metadata: dict | None = None) -> str:
     fmt = (fmt or path.rsplit(".", 1)[-1]).lower()
-    metadata = metadata or {}
-    if fmt == "npz":
-        if not path.endswith(".npz"):
-            path = path + ".npz"
-        np.savez(path, data=data.astype(np.float32), sample_rate=float(sample_rate),
-                 channel_names=np.array(channel_names), metadata=json.dumps(metadata))
-    elif fmt == "csv":
-        import csv
-
-        n = data.shape[1]
-        t = np.arange(n) / sample_rate if sample_rate else np.arange(n, dtype=float)
-        with open(path, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", *channel_names])
-            for i in range(n):
-                writer.writerow([t[i], *data[:, i].tolist()])
-    elif fmt == "edf":
-        import pyedflib
-
-        n_ch = data.shape[0]
-        writer = pyedflib.EdfWriter(path, n_ch, file_type=pyedflib.FILETYPE_EDFPLUS)
-        try:
-            headers = []
-            for i in range(n_ch):
-                ch = data[i]
-                headers.append({
-                    "label": channel_names[i], "dimension": "uV",
-                    "sample_frequency": float(sample_rate),
-                    "physical_min": float(min(ch.min(), -1.0)),
-                    "physical_max": float(max(ch.max(), 1.0)),
-                    "digital_min": -32768, "digital_max": 32767,
-                    "transducer": "", "prefilter": "",
-                })
-            writer.setSignalHeaders(headers)
-            writer.writeSamples([data[i].astype(np.float64) for i in range(n_ch)])
-        finally:
-            writer.close()
-    else:
+    writer = _WRITERS.get(fmt)
+    if writer is None:
         raise ValueError(f"Unsupported recording format: {fmt}")
-    return path
+    return writer(data, sample_rate, channel_names, path, metadata or {})
@@ -84,3 +84,56 @@ def test_websocket_allows_local_origin_and_no_origin():
             assert "metrics" in body or "status" in body
     finally:
         pipeline.stop()
+
+
+def test_websocket_clients_share_one_encoded_frame(monkeypatch):
+    from bci_mcp.dsp.state import BrainState
+
+    pipeline = Pipeline("synthetic://?seed=1")
+    pipeline.start()
+    time.sleep(0.6)
+    pipeline.stop()  # freeze: current_state() now returns one BrainState
+    assert pipeline.current_state() is not None
+    encodes = []
+    original = BrainState.to_dict
+
+    def counting_to_dict(self):
+        encodes.append(self)
+        return original(self)
+
+    monkeypatch.setattr(BrainState, "to_dict", counting_to_dict)
+    client = TestClient(create_app(pipeline))
+    with client.websocket_connect("/ws") as a, client.websocket_connect("/ws") as b, \
+            client.websocket_connect("/ws") as c:
+        frames = [ws.receive_text() for ws in (a, b, c) for _ in range(2)]
+    assert len(set(frames)) == 1
+    assert len(encodes) == 1  # one encode for six frames across three sockets
+
+
+def test_websocket_ignores_client_messages_and_keeps_streaming():
+    pipeline = Pipeline("synthetic://?seed=1")
+    pipeline.start()
+    client = TestClient(create_app(pipeline))
+    try:
+        with client.websocket_connect("/ws") as ws:
+            ws.send_text("ping")
+            ws.send_bytes(b"\x00")
+            for _ in range(2):
+                body = ws.receive_json()
+                assert "metrics" in body or "status" in body
+    finally:
+        pipeline.stop()
+
+
+def test_websocket_closes_with_1011_when_the_pipeline_fails():
+    from starlette.websockets import WebSocketDisconnect
+
+    class BrokenPipeline:
+        def current_state(self):
+            raise RuntimeError("DSP failed")
+
+    client = TestClient(create_app(BrokenPipeline()))
+    with client.websocket_connect("/ws") as ws:
+        with pytest.raises(WebSocketDisconnect) as closed:
+            ws.receive_json()
+    assert closed.value.code == 1011
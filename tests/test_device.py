@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from bci_mcp.core.device import Chunk, Device, DeviceInfo
+from bci_mcp.core.device import Chunk, Device, DeviceInfo, backfilled_timestamps
 
 
 def test_device_info_defaults():
@@ -20,3 +20,8 @@ def test_chunk_holds_array():
 def test_device_is_abstract():
     with pytest.raises(TypeError):
         Device()  # cannot instantiate ABC with abstract methods
+
+
+def test_backfilled_timestamps_end_at_the_arrival_time():
+    ts = backfilled_timestamps(10.0, 4, 2.0)
+    assert np.allclose(ts, [8.5, 9.0, 9.5, 10.0])
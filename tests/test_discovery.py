@@ -21,3 +21,26 @@ def test_discover_returns_entries_with_uris():
     assert any(e["uri"].startswith("synthetic://") for e in entries)
     for e in entries:
         assert "uri" in e and "name" in e
+
+
+def test_serial_port_scan_is_cached(monkeypatch):
+    from bci_mcp.core import registry
+
+    calls = []
+
+    def _fake_scan():
+        calls.append(1)
+        return [{"uri": "serial:///dev/ttyFAKE", "name": "fake", "needs_hardware": True}]
+
+    monkeypatch.setattr(registry, "_scan_serial_ports", _fake_scan)
+    monkeypatch.setattr(registry, "_port_cache", None)
+    first = discover()
+    first[-1]["name"] = "mutated by caller"
+    second = discover()
+    assert len(calls) == 1
+    assert second[-1] == {"uri": "serial:///dev/ttyFAKE", "name": "fake",
+                          "needs_hardware": True}
+
+    monkeypatch.setattr(registry, "_PORT_CACHE_TTL", 0.0)
+    discover()
+    assert len(calls) == 2
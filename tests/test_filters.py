@@ -1,6 +1,6 @@
 import numpy as np
 
-from bci_mcp.dsp.filters import bandpass, notch
+from bci_mcp.dsp.filters import bandpass, notch, notch_bandpass
 
 
 def _sine(freq, fs, n, ch=1):
@@ -31,3 +31,25 @@ def test_notch_above_nyquist_returns_input():
     data = _sine(10, 100.0, 64)
     out = notch(data, fs=100.0, freq=60.0)  # 60 Hz >= Nyquist (50 Hz)
     assert np.array_equal(out, data)
+
+
+def test_bandpass_stable_at_high_sample_rate():
+    # A 0.5 Hz edge at 2 kHz puts the poles close to the unit circle; the
+    # polynomial (b, a) form goes NaN here, the biquad cascade must not.
+    fs, n = 2000.0, 8000
+    sig = _sine(10, fs, n)
+    out = bandpass(sig, fs, low=0.5, order=6)
+    assert np.all(np.isfinite(out))
+    assert np.std(out) > 0.5 * np.std(sig)
+
+
+def test_notch_bandpass_matches_sequential_filters_in_band():
+    fs, n = 256.0, 2048
+    sig = _sine(10, fs, n) + _sine(60, fs, n) + _sine(80, fs, n)
+    combined = notch_bandpass(sig, fs, freq=60.0)
+    sequential = bandpass(notch(sig, fs, freq=60.0), fs)
+    mid = slice(n // 4, 3 * n // 4)  # zero-phase edge padding differs slightly
+    assert np.allclose(combined[:, mid], sequential[:, mid], atol=0.05)
+    fft = np.abs(np.fft.rfft(combined[0]))
+    freqs = np.fft.rfftfreq(n, 1 / fs)
+    assert fft[np.argmin(np.abs(freqs - 60))] < 0.05 * fft[np.argmin(np.abs(freqs - 10))]
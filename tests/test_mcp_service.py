@@ -41,6 +41,63 @@ def test_server_module_registers_tools():
     assert callable(server.serve)
 
 
+def test_stdio_serve_runs_the_sdk_stdio_loop(monkeypatch):
+    import anyio
+
+    from bci_mcp.mcp import server
+
+    calls = []
+    monkeypatch.delenv("PORT", raising=False)
+    monkeypatch.setattr(anyio, "run", lambda fn, **kw: calls.append((fn, kw)))
+    server.serve("stdio")
+    assert calls == [(server.mcp.run_stdio_async,
+                      {"backend_options": {"use_uvloop": server._uvloop_available()}})]
+
+
+def test_port_env_switches_stdio_to_authenticated_http(monkeypatch):
+    import anyio
+    import uvicorn
+
+    from bci_mcp.mcp import server
+    from bci_mcp.mcp.auth import TokenAuthMiddleware
+
+    served = []
+    monkeypatch.setenv("PORT", "8123")
+    monkeypatch.setattr(anyio, "run", lambda *a, **kw: served.append("stdio"))
+    monkeypatch.setattr(uvicorn, "run", lambda app, **kw: served.append(app))
+    server.serve("stdio")
+    assert len(served) == 1
+    assert isinstance(served[0], TokenAuthMiddleware)
+
+
+def test_list_devices_tool_runs_off_the_event_loop(monkeypatch):
+    import asyncio
+    import time
+
+    from bci_mcp.core import registry
+    from bci_mcp.mcp import server
+
+    def slow_scan():
+        time.sleep(0.5)  # a cold, blocking serial port enumeration
+        return []
+
+    monkeypatch.setattr(registry, "_scan_serial_ports", slow_scan)
+    monkeypatch.setattr(registry, "_port_cache", None)
+
+    async def scenario():
+        t0 = time.monotonic()
+        listing = asyncio.create_task(server.mcp.call_tool("list_devices", {}))
+        await asyncio.sleep(0.05)
+        await server.mcp.call_tool("mark_event", {"label": "during discovery"})
+        elapsed = time.monotonic() - t0
+        result = await listing
+        return elapsed, result
+
+    elapsed, result = asyncio.run(scenario())
+    assert elapsed < 0.3
+    assert "synthetic" in str(result)
+
+
 def test_methods_report_not_connected():
     svc = BrainService()
     assert "error" in svc.get_band_powers()
@@ -80,3 +137,95 @@ def test_neurofeedback_requires_connection():
     svc = BrainService()
     assert "error" in svc.start_neurofeedback()
     assert "error" in svc.get_neurofeedback_score()
+
+
+def test_blocking_tools_do_not_stall_the_event_loop():
+    import asyncio
+    import time
+
+    from bci_mcp.mcp import server
+
+    async def scenario():
+        await server.mcp.call_tool("connect", {"device_uri": "synthetic://?seed=1"})
+        try:
+            # t0 before the calibrate call: a sync tool would block the loop
+            # inside the sleep below, and the delay must count.
+            t0 = time.monotonic()
+            cal = asyncio.create_task(server.mcp.call_tool("calibrate", {"seconds": 1}))
+            await asyncio.sleep(0.05)
+            await server.mcp.call_tool("mark_event", {"label": "during calibration"})
+            elapsed = time.monotonic() - t0
+            await cal
+        finally:
+            await server.mcp.call_tool("disconnect", {})
+        return elapsed
+
+    assert asyncio.run(scenario()) < 0.5
+
+
+def test_device_info_tracks_the_connection():
+    svc = BrainService()
+    assert svc.device_info()["connected"] is False
+    svc.connect("synthetic://?seed=1")
+    try:
+        info = svc.device_info()
+        assert info["connected"] is True
+        assert info["channel_count"] == 4
+        assert svc.device_info() is info  # memoized per connection
+        svc.connect("synthetic://?seed=1&channels=2")
+        assert svc.device_info()["channel_count"] == 2
+    finally:
+        svc.disconnect()
+    assert svc.device_info()["connected"] is False
+
+
+def test_only_one_capture_runs_at_a_time(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    monkeypatch.setenv("BCI_RECORD_DIR", str(tmp_path))
+    svc = BrainService()
+    svc.connect("synthetic://?seed=1")
+    try:
+        cal = threading.Thread(target=svc.calibrate, kwargs={"seconds": 1})
+        cal.start()
+        time.sleep(0.1)
+        assert svc.record(seconds=1, path="busy.npz") == {
+            "error": "a recording/calibration is already running"}
+        assert "error" in svc.calibrate(seconds=1)
+        cal.join()
+        assert svc.calibrate(seconds=0.3)["calibrated"] is True  # free again
+    finally:
+        svc.disconnect()
+
+
+def test_calibrate_reports_a_disconnect_mid_capture():
+    import threading
+    import time
+
+    svc = BrainService()
+    svc.connect("synthetic://?seed=1")
+    time.sleep(0.6)
+    out = {}
+    cal = threading.Thread(target=lambda: out.update(svc.calibrate(seconds=0.6)))
+    cal.start()
+    time.sleep(0.1)
+    svc.disconnect()
+    cal.join()
+    assert out == {"error": "device was disconnected during calibration"}
+
+
+def test_record_reports_a_disconnect_mid_capture(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    monkeypatch.setenv("BCI_RECORD_DIR", str(tmp_path))
+    svc = BrainService()
+    svc.connect("synthetic://?seed=1")
+    out = {}
+    rec = threading.Thread(target=lambda: out.update(svc.record(seconds=0.6, path="r.npz")))
+    rec.start()
+    time.sleep(0.1)
+    svc.disconnect()
+    rec.join()
+    assert out["error"] == "device was disconnected during recording"
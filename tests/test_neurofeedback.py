@@ -40,3 +40,19 @@ def test_score_dict_shape():
     score = sess.score()
     assert "in_zone" in score and "cumulative_in_zone_pct" in score
     assert score["in_zone"] is True
+
+
+def test_summary_mean_and_restart():
+    pipe = FakePipeline([0.2, 0.4, 0.9, 0.5])
+    sess = NeurofeedbackSession(pipe, metric="focus", target=0.7)
+    sess.start()
+    for _ in range(3):
+        sess.sample()
+    assert abs(sess.summary().mean_score - 0.5) < 1e-9
+    assert sess.score()["current"] == 0.9
+    sess.start()  # restart resets the running aggregates
+    assert sess.score()["current"] is None
+    sess.sample()
+    summary = sess.summary()
+    assert summary.samples == 1
+    assert abs(summary.mean_score - 0.5) < 1e-9
@@ -4,21 +4,31 @@ import numpy as np
 import pytest
 
 from bci_mcp.core.registry import create_device
+from bci_mcp.devices import neurofocus_protocol as proto
 from bci_mcp.devices.neurofocus import NeuroFocusDevice
 
 
 class FakeSerial:
-    def __init__(self, lines):
-        self._lines = list(lines)
+    """Byte-stream port; each entry in *reads* is what one read() can return."""
+
+    def __init__(self, lines=(), reads=None):
+        self._reads = list(reads) if reads is not None else [
+            (line + "\n").encode() for line in lines]
         self.is_open = True
         self.written = []
 
     @property
     def in_waiting(self):
-        return len(self._lines)
+        return len(self._reads[0]) if self._reads else 0
 
-    def readline(self):
-        return (self._lines.pop(0) + "\n").encode() if self._lines else b""
+    def read(self, size=1):
+        if not self._reads:
+            time.sleep(0.01)  # emulate the port's read timeout
+            return b""
+        data = self._reads.pop(0)
+        if len(data) > size:
+            self._reads.insert(0, data[size:])
+        return data[:size]
 
     def write(self, data):
         self.written.append(data)
@@ -27,10 +37,7 @@ class FakeSerial:
         self.is_open = False
 
 
-def test_serial_transport_converts_counts_to_uv():
-    fake = FakeSerial(["1000000", "-1000000"])
-    dev = NeuroFocusDevice(transport="serial", port="/dev/fake",
-                           serial_factory=lambda *a, **k: fake)
+def _drain(dev):
     dev.connect()
     dev.start()
     time.sleep(0.2)
@@ -42,7 +49,14 @@ def test_serial_transport_converts_counts_to_uv():
         time.sleep(0.02)
     dev.stop()
     dev.disconnect()
-    data = np.concatenate(chunks, axis=1)
+    return np.concatenate(chunks, axis=1) if chunks else np.zeros((1, 0))
+
+
+def test_serial_transport_converts_counts_to_uv():
+    fake = FakeSerial(["1000000", "-1000000"])
+    dev = NeuroFocusDevice(transport="serial", port="/dev/fake",
+                           serial_factory=lambda *a, **k: fake)
+    data = _drain(dev)
     # 1,000,000 counts × (0.3933/100) µV ≈ 3933 µV
     assert abs(data[0, 0] - 1_000_000 * (3.3 / 8_388_608 * 1e6 / 100.0)) < 1.0
     assert b"b" in fake.written  # start command sent
@@ -80,3 +94,28 @@ def test_ble_connect_surfaces_not_found(monkeypatch):
     dev = NeuroFocusDevice(transport="ble", ble_name="DOES_NOT_EXIST")
     with pytest.raises(RuntimeError):
         dev.connect()
+
+
+def test_serial_transport_reassembles_frames_split_across_reads():
+    import struct
+
+    batch = b"\xe7\x1e\x00\x02" + bytes([2]) + struct.pack("<2i", 7, 8) + b"\n"
+    truncated = b"\xe7\x1e\x00\x02" + bytes([2]) + struct.pack("<i", 9) + b"\n"
+    fake = FakeSerial(reads=[b"-123", b"45\n", batch[:6], batch[6:], truncated, b"6\n"])
+    dev = NeuroFocusDevice(transport="serial", port="/dev/fake",
+                           serial_factory=lambda *a, **k: fake)
+    data = _drain(dev)
+    expected = proto.counts_to_uv(np.array([-12345, 7, 8, 6]))
+    assert np.allclose(data[0], expected)
+    assert dev._thread is not None and not dev._thread.is_alive()  # stopped, not crashed
+
+
+def test_undrained_samples_are_capped_by_count_not_frames(caplog):
+    # 1 Hz keeps the pending cap at 60 samples; each binary batch carries 25.
+    dev = NeuroFocusDevice(transport="serial", port="/dev/fake", sample_rate=1.0)
+    for i in range(4):
+        dev._emit_counts(np.arange(25 * i, 25 * (i + 1)))
+    chunk = dev.read()
+    assert np.allclose(chunk.data[0], proto.counts_to_uv(np.arange(40, 100)))
+    drops = [r for r in caplog.records if "dropping the oldest" in r.getMessage()]
+    assert len(drops) == 1
@@ -39,3 +39,13 @@ def test_counts_array_to_uv_chunk():
     uv = nf.counts_to_uv(counts)
     assert uv.shape == (3,)
     assert uv[0] == 0.0
+
+
+def test_decode_binary_batch_frame_is_array():
+    samples = [1, -2, 2**23 - 1, -(2**23)]
+    payload = b"\xe7\x1e" + struct.pack("<H", 7) + struct.pack("<B", len(samples))
+    payload += struct.pack(f"<{len(samples)}i", *samples)
+    out = nf.decode_frame(payload)
+    assert out.dtype == np.int64
+    assert out.tolist() == samples
+    assert nf.decode_frame(b"nope").size == 0
@@ -32,3 +32,54 @@ def test_calibrate_sets_baseline():
         assert p.current_state().calibrated
     finally:
         p.stop()
+
+
+def test_current_state_is_reused_until_new_samples_arrive():
+    p = Pipeline("synthetic://?seed=3", window_seconds=1.0)
+    p.start()
+    time.sleep(1.2)
+    p.stop()  # freeze the buffer
+    first = p.current_state()
+    assert first is not None
+    assert p.current_state() is first
+    p.notch_freq = 50.0  # a settings change invalidates the reading
+    assert p.current_state() is not first
+
+
+def test_record_flags_chunks_dropped_during_the_session(tmp_path, monkeypatch):
+    import threading
+
+    from bci_mcp.core import stream as stream_mod
+    from bci_mcp.recording.reader import load_recording
+
+    monkeypatch.setattr(stream_mod, "_MAX_PENDING_CHUNKS", 2)
+    p = Pipeline("synthetic://?seed=1")
+    release = threading.Event()
+    p.stream.add_consumer(lambda chunk: release.wait())  # stalls, then catches up
+    threading.Timer(1.2, release.set).start()
+    p.start()
+    try:
+        out = p.record(seconds=1.0, path=str(tmp_path / "gappy.npz"))
+    finally:
+        release.set()
+        p.stop()
+    metadata = load_recording(out).metadata
+    assert metadata["dropped_chunks"] > 0
+    assert metadata["missing_samples"] > 0
+
+
+def test_record_keeps_exactly_the_session_behind_a_slow_consumer(tmp_path):
+    from bci_mcp.recording.reader import load_recording
+
+    p = Pipeline("synthetic://?seed=1")  # 256 Hz, 32-sample chunks
+    p.stream.add_consumer(lambda chunk: time.sleep(0.2))  # slower than real time
+    p.start()
+    try:
+        time.sleep(0.5)  # stale backlog that belongs before the session
+        out = p.record(seconds=1.0, path=str(tmp_path / "lagged.npz"))
+    finally:
+        p.stop()
+    rec = load_recording(out)
+    # Wall-clock start/stop on the lagging queue kept about half of this.
+    assert 224 <= rec.data.shape[1] <= 288
+    assert "missing_samples" not in rec.metadata
@@ -40,3 +40,16 @@ def test_record_then_playback_via_pipeline(tmp_path):
     dev = create_device(f"playback://{path}")
     assert isinstance(dev, PlaybackDevice)
     assert dev.info.channel_count == 4
+
+
+def test_looped_playback_spans_the_seam():
+    data = np.arange(10, dtype=np.float32).reshape(1, 10)
+    rec = Recording(data=data, sample_rate=10.0, channel_names=["ch1"])
+    dev = PlaybackDevice(rec, chunk_samples=4, loop=True)
+    dev.start()
+    chunks = [dev.read() for _ in range(5)]
+    assert all(c.data.shape == (1, 4) for c in chunks)
+    out = np.concatenate([c.data for c in chunks], axis=1)
+    assert np.array_equal(out[0], np.arange(20) % 10)
+    ts = np.concatenate([c.timestamps for c in chunks])
+    assert np.all(np.diff(ts) > 0)
@@ -0,0 +1,60 @@
+import numpy as np
+
+from bci_mcp.core.device import Chunk
+from bci_mcp.recording.recorder import Recorder
+
+
+def _chunk(values, dtype=np.float64):
+    data = np.asarray(values, dtype=dtype)
+    return Chunk(data=data, timestamps=np.arange(data.shape[1], dtype=np.float64))
+
+
+def test_recorder_concatenates_chunks_as_float32():
+    rec = Recorder()
+    rec.start()
+    rec(_chunk([[1, 2], [3, 4]]))
+    rec(_chunk([[5], [6]]))
+    out = rec.data()
+    assert out.dtype == np.float32
+    assert np.array_equal(out, [[1, 2, 5], [3, 4, 6]])
+
+
+def test_recorder_ignores_chunks_while_inactive():
+    rec = Recorder()
+    rec(_chunk([[1.0]]))
+    rec.start()
+    rec(_chunk([[2.0]]))
+    rec.stop()
+    rec(_chunk([[3.0]]))
+    assert np.array_equal(rec.data(), [[2.0]])
+
+
+def test_recorder_copies_chunk_data():
+    rec = Recorder()
+    rec.start()
+    chunk = _chunk([[1.0, 2.0]], dtype=np.float32)
+    rec(chunk)
+    chunk.data[:] = 0.0  # producer reuses its buffer
+    assert np.array_equal(rec.data(), [[1.0, 2.0]])
+
+
+def test_recorder_grows_past_initial_capacity():
+    rec = Recorder(expected_samples=4)
+    rec.start()
+    for i in range(10):
+        rec(_chunk([[3 * i, 3 * i + 1, 3 * i + 2]]))
+    out = rec.data()
+    assert out.shape == (1, 30)
+    assert np.array_equal(out[0], np.arange(30))
+
+
+def test_recorder_keeps_only_its_sample_window():
+    rec = Recorder()
+    rec.start(first_sample=2)
+    for first in (0, 3, 6):  # three 3-sample chunks: samples 0..8
+        chunk = _chunk([[first, first + 1, first + 2]])
+        chunk.first_sample = first
+        rec(chunk)
+        if first == 3:
+            rec.stop(end_sample=7)  # later chunks are still delivered
+    assert np.array_equal(rec.data(), [[2, 3, 4, 5, 6]])
@@ -34,3 +34,16 @@ def test_edf_roundtrip(tmp_path):
     assert rec.sample_rate == 256.0
     # EDF stores with finite precision; check correlation not exact equality
     assert np.corrcoef(rec.data[0], data[0])[0, 1] > 0.99
+
+
+def test_csv_written_in_blocks_matches_single_block(tmp_path, monkeypatch):
+    from bci_mcp.recording import writer
+
+    data = np.random.default_rng(1).normal(0, 20, (3, 1000)).astype(np.float32)
+    whole = save_recording(data, 250.0, ["a", "b", "c"], str(tmp_path / "whole.csv"))
+    monkeypatch.setattr(writer, "_CSV_BLOCK", 64)
+    blocked = save_recording(data, 250.0, ["a", "b", "c"], str(tmp_path / "blocked.csv"))
+    assert open(whole).read() == open(blocked).read()
+    rec = load_recording(blocked)
+    assert rec.data.shape == (3, 1000)
+    assert np.array_equal(rec.data, data)
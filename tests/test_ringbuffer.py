@@ -30,3 +30,28 @@ def test_latest_more_than_available():
     rb = RingBuffer(channels=1, capacity=10)
     rb.write(np.array([[1, 2]], dtype=np.float32))
     assert rb.latest(100).shape == (1, 2)
+
+
+def test_block_write_across_wrap_point():
+    rb = RingBuffer(channels=2, capacity=5)
+    rb.write(np.array([[0, 1, 2], [3, 4, 5]], dtype=np.float32))
+    rb.write(np.array([[10, 11, 12], [13, 14, 15]], dtype=np.float32))  # wraps by one
+    assert len(rb) == 5
+    assert np.array_equal(rb.latest(5), [[1, 2, 10, 11, 12], [4, 5, 13, 14, 15]])
+    assert np.array_equal(rb.latest(2), [[11, 12], [14, 15]])
+
+
+def test_any_capacity_matches_a_plain_history():
+    # The cursor wraps by compare-and-subtract, so capacity need not be a power
+    # of two (the pipeline's is sample_rate x 10 s, e.g. 2560).
+    rng = np.random.default_rng(0)
+    for capacity in (7, 10, 2560):
+        rb = RingBuffer(channels=2, capacity=capacity)
+        history = np.zeros((2, 0), dtype=np.float32)
+        for _ in range(50):
+            n = int(rng.integers(0, capacity + 3))
+            block = rng.normal(size=(2, n)).astype(np.float32)
+            rb.write(block)
+            history = np.concatenate([history, block], axis=1)[:, -capacity:]
+            k = int(rng.integers(0, capacity + 1))
+            assert np.array_equal(rb.latest(k), history[:, history.shape[1] - min(k, len(rb)):])
@@ -6,19 +6,23 @@ from bci_mcp.devices.serial_device import SerialDevice
 
 
 class FakeSerial:
-    """Minimal stand-in for serial.Serial yielding canned ASCII lines."""
+    """Minimal stand-in for serial.Serial yielding canned ASCII lines as bytes."""
 
     def __init__(self, lines):
-        self._lines = list(lines)
+        self._data = b"".join((line + "\n").encode() for line in lines)
         self.is_open = True
         self.written = []
 
     @property
     def in_waiting(self):
-        return len(self._lines)
+        return len(self._data)
 
-    def readline(self):
-        return (self._lines.pop(0) + "\n").encode() if self._lines else b""
+    def read(self, size=1):
+        if not self._data:
+            time.sleep(0.01)  # emulate the port's read timeout
+            return b""
+        out, self._data = self._data[:size], self._data[size:]
+        return out
 
     def write(self, data):
         self.written.append(data)
@@ -27,6 +31,14 @@ class FakeSerial:
         self.is_open = False
 
 
+class DribbleSerial(FakeSerial):
+    """Delivers a few bytes per read so lines straddle block boundaries."""
+
+    @property
+    def in_waiting(self):
+        return min(3, len(self._data))
+
+
 def test_serial_reads_ascii_ints_as_uv():
     fake = FakeSerial(["100", "-50", "garbage", "25"])
     dev = SerialDevice(port="/dev/fake", sample_rate=250.0, scale_uv=1.0,
@@ -59,3 +71,49 @@ def test_start_writes_start_command_when_configured():
     dev.stop()
     dev.disconnect()
     assert b"b" in fake.written
+
+
+def test_serial_reassembles_lines_split_across_reads():
+    fake = DribbleSerial(["12345", "-678", "9"])
+    dev = SerialDevice(port="/dev/fake", scale_uv=2.0,
+                       serial_factory=lambda *a, **k: fake)
+    dev.connect()
+    dev.start()
+    time.sleep(0.2)
+    dev.stop()
+    dev.disconnect()
+    chunk = dev.read()
+    assert chunk is not None
+    assert chunk.data[0].tolist() == [24690.0, -1356.0, 18.0]
+
+
+def test_timestamps_are_evenly_spaced_on_the_monotonic_clock():
+    fake = FakeSerial(["1", "2", "3", "4"])
+    dev = SerialDevice(port="/dev/fake", sample_rate=250.0,
+                       serial_factory=lambda *a, **k: fake)
+    dev.connect()
+    dev.start()
+    time.sleep(0.2)
+    dev.stop()
+    dev.disconnect()
+    chunk = dev.read()
+    assert chunk is not None and chunk.timestamps.shape == (4,)
+    assert np.allclose(np.diff(chunk.timestamps), 1 / 250.0)
+    assert 0.0 <= time.monotonic() - chunk.timestamps[-1] < 5.0
+
+
+def test_undrained_samples_are_capped_to_the_newest(caplog):
+    fake = DribbleSerial([str(i) for i in range(100)])  # several overflowing blocks
+    # 1 Hz keeps the pending cap at 60 samples.
+    dev = SerialDevice(port="/dev/fake", sample_rate=1.0,
+                       serial_factory=lambda *a, **k: fake)
+    dev.connect()
+    dev.start()
+    time.sleep(0.2)
+    dev.stop()
+    dev.disconnect()
+    chunk = dev.read()
+    assert chunk is not None
+    assert chunk.data[0].tolist() == [float(i) for i in range(40, 100)]
+    drops = [r for r in caplog.records if "dropping the oldest" in r.getMessage()]
+    assert len(drops) == 1
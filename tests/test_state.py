@@ -40,3 +40,15 @@ def test_unreliable_status_shows_in_summary():
     s = _state()
     s.status = "unreliable"
     assert "unreliable" in s.summary().lower()
+
+
+def test_to_dict_matches_asdict_and_is_independent():
+    from dataclasses import asdict
+
+    s = _state()
+    d = s.to_dict()
+    assert d == asdict(s)
+    d["metrics"]["focus"] = 0.0
+    d["artifacts"].append("blink")
+    assert s.metrics["focus"] == 0.7
+    assert s.artifacts == []
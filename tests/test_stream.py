@@ -24,3 +24,102 @@ def test_consumer_receives_chunks():
     time.sleep(0.2)
     s.stop()
     assert len(received) > 0
+
+
+def test_slow_consumer_does_not_stall_acquisition():
+    dev = SyntheticDevice(channels=1, sample_rate=256.0, chunk_samples=32, seed=1)
+    s = Stream(dev, buffer_seconds=2.0)
+    s.add_consumer(lambda chunk: time.sleep(0.3))
+    s.start()
+    time.sleep(0.4)
+    filled = s.latest(256).shape[1]
+    s.stop()
+    # A producer blocked on the consumer would hold a single 32-sample chunk.
+    assert filled >= 64
+
+
+def test_consumers_see_chunks_in_order():
+    dev = SyntheticDevice(channels=1, sample_rate=256.0, chunk_samples=32, seed=1)
+    s = Stream(dev)
+    stamps = []
+    s.add_consumer(lambda chunk: stamps.append(float(chunk.timestamps[0])))
+    s.start()
+    time.sleep(0.3)
+    s.stop()
+    assert len(stamps) > 1
+    assert stamps == sorted(stamps)
+
+
+def test_stop_does_not_wait_out_the_poll_period():
+    # A 2 s chunk period: a plain sleep() in the producer would hold stop() for it.
+    dev = SyntheticDevice(channels=1, sample_rate=16.0, chunk_samples=32, seed=1)
+    s = Stream(dev)
+    s.start()
+    time.sleep(0.05)
+    t0 = time.monotonic()
+    s.stop()
+    assert time.monotonic() - t0 < 0.5
+    s.start()  # restartable after stop
+    s.stop()
+
+
+def test_failing_consumer_logs_one_traceback(caplog):
+    dev = SyntheticDevice(channels=1, sample_rate=256.0, chunk_samples=32, seed=1)
+    s = Stream(dev)
+    calls = []
+
+    def broken(chunk):
+        calls.append(chunk)
+        raise RuntimeError("boom")
+
+    s.add_consumer(broken)
+    with caplog.at_level("ERROR", logger="bci_mcp.core.stream"):
+        s.start()
+        time.sleep(0.4)
+        s.stop()
+    assert len(calls) > 1
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 1
+
+
+def test_overflowing_backlog_counts_drops_and_warns_once(monkeypatch, caplog):
+    import threading
+
+    from bci_mcp.core import stream as stream_mod
+
+    monkeypatch.setattr(stream_mod, "_MAX_PENDING_CHUNKS", 2)
+    dev = SyntheticDevice(channels=1, sample_rate=256.0, chunk_samples=8, seed=1)
+    s = Stream(dev)
+    release = threading.Event()
+    s.add_consumer(lambda chunk: release.wait(2.0))
+    with caplog.at_level("WARNING", logger="bci_mcp.core.stream"):
+        s.start()
+        time.sleep(0.4)
+        release.set()
+        s.stop()
+    assert s.dropped_chunks > 0
+    assert len([r for r in caplog.records if "dropping the oldest" in r.message]) == 1
+
+
+def test_restart_waits_for_the_previous_dispatcher():
+    import threading
+
+    dev = SyntheticDevice(channels=1, sample_rate=256.0, chunk_samples=8, seed=1)
+    s = Stream(dev)
+    active = []
+    overlaps = []
+
+    def slow(chunk):
+        active.append(threading.get_ident())
+        if len(set(active)) > 1:
+            overlaps.append(chunk)
+        time.sleep(0.2)
+        active.remove(threading.get_ident())
+
+    s.add_consumer(slow)
+    s.start()
+    time.sleep(0.5)  # builds a backlog stop() cannot drain within its 1 s join
+    s.stop()
+    s.start()
+    time.sleep(0.5)
+    s.stop()
+    assert overlaps == []